@@ -1,222 +1,309 @@
-# coding=utf-8
-from __future__ import absolute_import
-import threading
-import logging
-
-# Debug: Log when module is being imported
-_startup_logger = logging.getLogger("octoprint.plugins.psucontrol_tapo.startup")
-_startup_logger.info("=== PSU Control Shenzhen module is being imported ===")
-
-__author__ = "Dennis Schwerdel <schwerdel@gmail.com>, Modified for Shenzhen SM-PW701A1"
-__license__ = "GNU Affero General Public License http://www.gnu.org/licenses/agpl.html"
-__copyright__ = "Copyright (C) 2022 Dennis Schwerdel - Released under terms of the AGPLv3 License"
-
-# Import modules for standalone usage
-from .shenzhen import ShenzhenSmartPlug, TasmotaSmartPlug, RobustTuyaSmartPlug
-from . import shenzhen
-
-_startup_logger.info("=== Shenzhen module imports successful ===")
-
-# Import octoprint
-import octoprint.plugin
-
-_startup_logger.info("=== OctoPrint plugin import successful ===")
-
-
-class PSUControl_Shenzhen(octoprint.plugin.StartupPlugin,
-                          octoprint.plugin.RestartNeedingPlugin,
-                          octoprint.plugin.TemplatePlugin,
-                          octoprint.plugin.SettingsPlugin):
-
-    def __init__(self):
-        self.config = dict()
-        self.device = None
-        self.last_status = None
-        self._status_lock = threading.Lock()
-
-    def get_settings_defaults(self):
-        return dict(
-            protocol='tasmota',  # 'tasmota' (recommended) or 'tuya'
-            address='',
-            # Tasmota settings
-            tasmota_username='',
-            tasmota_password='',
-            # Tuya settings (for stock firmware)
-            device_id='',
-            local_key='',
-            version='3.3'
-        )
-
-    def on_settings_initialized(self):
-        self.reload_settings()
-
-    def on_settings_save(self, data):
-        octoprint.plugin.SettingsPlugin.on_settings_save(self, data)
-        self.reload_settings()
-
-    def get_settings_version(self):
-        return 2
-
-    def on_settings_migrate(self, target, current=None):
-        if current is None or current < 2:
-            # Migrate from old Tuya-only settings
-            self._settings.set(["protocol"], "tuya")
-
-    def _reconnect(self):
-        protocol = self.config.get('protocol', 'tasmota')
-        self._logger.info(f"Reconnecting to {protocol} device at {self.config['address']}")
-        
-        try:
-            if protocol == 'tasmota':
-                self.device = ShenzhenSmartPlug(
-                    protocol="tasmota",
-                    address=self.config["address"],
-                    username=self.config.get("tasmota_username", ""),
-                    password=self.config.get("tasmota_password", "")
-                )
-            else:  # tuya
-                self.device = ShenzhenSmartPlug(
-                    protocol="tuya",
-                    address=self.config["address"],
-                    device_id=self.config.get("device_id", ""),
-                    local_key=self.config.get("local_key", ""),
-                    version=self.config.get("version", "3.3")
-                )
-            self._logger.info(f"{protocol.title()} device reconnected successfully")
-        except Exception as e:
-            self._logger.error(f"Failed to reconnect to {protocol} device: {type(e).__name__}: {e}")
-            self.device = None
-            raise
-
-    def reload_settings(self):
-        for k, v in self.get_settings_defaults().items():
-            if type(v) == str:
-                v = self._settings.get([k])
-            elif type(v) == int:
-                v = self._settings.get_int([k])
-            elif type(v) == float:
-                v = self._settings.get_float([k])
-            elif type(v) == bool:
-                v = self._settings.get_boolean([k])
-
-            self.config[k] = v
-            self._logger.debug("{}: {}".format(k, v))
-        
-        try:
-            protocol = self.config.get('protocol', 'tasmota')
-            self._logger.info(f"Config loaded: protocol={protocol}, address={self.config.get('address')}")
-            shenzhen.log = self._logger
-            self._reconnect()
-        except Exception as e:
-            self._logger.error(f"Failed to connect to device: {type(e).__name__}: {e}", exc_info=True)
-            self.device = None
-
-    def on_startup(self, host, port):
-        self._logger.info("=== PSU Control Shenzhen on_startup called ===")
-        psucontrol_helpers = self._plugin_manager.get_helpers("psucontrol")
-        if not psucontrol_helpers or 'register_plugin' not in psucontrol_helpers.keys():
-            self._logger.warning("The version of PSUControl that is installed does not support plugin registration.")
-            return
-
-        self._logger.info("Registering plugin with PSUControl")
-        psucontrol_helpers['register_plugin'](self)
-
-    def turn_psu_on(self):
-        self._logger.info("=== TURN PSU ON requested ===")
-        if not self.device:
-            self._logger.warning("Device not connected, reconnecting...")
-            self._reconnect()
-        self._logger.info("Switching PSU On")
-        try:
-            self.device.set_status(True)
-            with self._status_lock:
-                self.last_status = True
-            self._logger.info("PSU turned ON successfully")
-        except Exception as e:
-            self._logger.error(f"Failed to switch PSU On: {type(e).__name__}: {e}", exc_info=True)
-            self.device = None
-            raise
-
-    def turn_psu_off(self):
-        self._logger.info("=== TURN PSU OFF requested ===")
-        if not self.device:
-            self._logger.warning("Device not connected, reconnecting...")
-            self._reconnect()
-        self._logger.info("Switching PSU Off")
-        try:
-            self.device.set_status(False)
-            with self._status_lock:
-                self.last_status = False
-            self._logger.info("PSU turned OFF successfully")
-        except Exception as e:
-            self._logger.error(f"Failed to switch PSU Off: {type(e).__name__}: {e}", exc_info=True)
-            self.device = None
-            raise
-
-    def _fetch_psu_state(self):
-        if not self.device:
-            self._logger.warning("Device not connected, reconnecting...")
-            self._reconnect()
-        self._logger.info("Fetching PSU state")
-        try:
-            status = self.device.get_status()
-            with self._status_lock:
-                self.last_status = status
-            self._logger.info(f"PSU state fetched: {status}")
-        except Exception as e:
-            self._logger.error(f"Failed to get PSU state: {type(e).__name__}: {e}", exc_info=True)
-            self.device = None
-            raise
-
-    def get_psu_state(self):
-        with self._status_lock:
-            cached_status = self.last_status
-        
-        if cached_status is None:
-            self._fetch_psu_state()
-            with self._status_lock:
-                return self.last_status
-        else:
-            # Fetch in background to update cache
-            threading.Thread(target=self._fetch_psu_state, daemon=True).start()
-            return cached_status
-
-    def get_template_configs(self):
-        return [
-            dict(type="settings", custom_bindings=False)
-        ]
-
-    def get_update_information(self):
-        return dict(
-            psucontrol_shenzhen=dict(
-                displayName="PSU Control - Shenzhen",
-                displayVersion=self._plugin_version,
-
-                # version check: github repository
-                type="github_release",
-                user="wafflexyzz",
-                repo="OctoPrint-PSU-Control-Tuya",
-                current=self._plugin_version,
-
-                # update method: pip w/ dependency links
-                pip="https://github.com/wafflexyzz/OctoPrint-PSU-Control-Tuya/archive/{target_version}.zip"
-            )
-        )
-
-
-__plugin_name__ = "PSU Control - Shenzhen"
-__plugin_pythoncompat__ = ">=3.7,<4"
-
-_startup_logger.info("=== About to define __plugin_load__ ===")
-
-def __plugin_load__():
-    global __plugin_implementation__
-    __plugin_implementation__ = PSUControl_Shenzhen()
-    _startup_logger.info(f"=== Plugin implementation created: {__plugin_implementation__} ===")
-
-    global __plugin_hooks__
-    __plugin_hooks__ = {
-        "octoprint.plugin.softwareupdate.check_config": __plugin_implementation__.get_update_information
-    }
-
-_startup_logger.info("=== PSU Control Shenzhen module fully loaded ===")
+# coding=utf-8
+from __future__ import absolute_import
+import concurrent.futures
+import threading
+import time
+import logging
+
+__author__ = "Dennis Schwerdel <schwerdel@gmail.com>, Modified for Shenzhen SM-PW701A1"
+__license__ = "GNU Affero General Public License http://www.gnu.org/licenses/agpl.html"
+__copyright__ = "Copyright (C) 2022 Dennis Schwerdel - Released under terms of the AGPLv3 License"
+
+# Import modules for standalone usage
+from .shenzhen import ShenzhenSmartPlug, TasmotaSmartPlug, RobustTuyaSmartPlug, UnrecoverableTuyaError
+from . import shenzhen
+
+# Import octoprint
+import octoprint.plugin
+
+# Guards lazy creation of per-instance locks
+_global_init_lock = threading.Lock()
+
+# Single shared worker for background status refreshes; reusing one thread
+# avoids spawning (and tearing down) a thread for every PSUControl poll.
+_refresh_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="psucontrol_shenzhen_refresh"
+)
+
+# Longest a poll will block waiting for a cold status fetch; a stuck
+# device keeps retrying on the worker but no longer hangs the poll thread.
+_FETCH_TIMEOUT = 15.0
+
+# Settings defaults, built once at import time; get_settings_defaults is
+# called on every settings load/save and should not allocate a fresh dict.
+_DEFAULTS = dict(
+    protocol='tasmota',  # 'tasmota' (recommended) or 'tuya'
+    address='',
+    # Tasmota settings
+    tasmota_username='',
+    tasmota_password='',
+    # Tuya settings (for stock firmware)
+    device_id='',
+    local_key='',
+    version='3.3',
+    # Seconds a fetched PSU state is served from cache before re-polling
+    cache_ttl=5.0
+)
+
+# Key -> typed settings getter name, derived once from _DEFAULTS at import
+# so reload_settings never has to inspect the default values again.
+_GETTER_NAME_BY_TYPE = {str: "get", int: "get_int", float: "get_float", bool: "get_boolean"}
+_SETTING_GETTER_NAMES = {k: _GETTER_NAME_BY_TYPE[type(v)] for k, v in _DEFAULTS.items()}
+
+
+class PSUControl_Shenzhen(octoprint.plugin.StartupPlugin,
+                          octoprint.plugin.RestartNeedingPlugin,
+                          octoprint.plugin.TemplatePlugin,
+                          octoprint.plugin.SettingsPlugin):
+
+    def __init__(self):
+        self.config = dict()
+        self.device = None
+        self.last_status = None
+        self._status_lock = None
+        self._config_hash = None
+        self._setting_getters = None
+        self._device_kwargs = None
+        self._psucontrol_helpers = None
+        self._registered = False
+        self._last_fetch_ts = 0.0
+        self._cache_ttl = _DEFAULTS['cache_ttl']
+
+    def _get_lock(self):
+        # Lazily allocate the status lock on first contended access; most
+        # single-client setups never need it before the first state change.
+        lk = self._status_lock
+        if lk is None:
+            with _global_init_lock:
+                lk = self._status_lock or threading.Lock()
+                self._status_lock = lk
+        return lk
+
+    def get_settings_defaults(self):
+        return _DEFAULTS
+
+    def on_settings_initialized(self):
+        # Route the device module's logging through the plugin logger once;
+        # reload_settings no longer re-assigns it on every save.
+        shenzhen.log = self._logger
+        self.reload_settings()
+
+    def on_settings_save(self, data):
+        octoprint.plugin.SettingsPlugin.on_settings_save(self, data)
+        self.reload_settings()
+
+    def get_settings_version(self):
+        return 2
+
+    def on_settings_migrate(self, target, current=None):
+        if current is None or current < 2:
+            # Migrate from old Tuya-only settings
+            self._settings.set(["protocol"], "tuya")
+
+    def _build_device_kwargs(self):
+        protocol = self.config.get('protocol', 'tasmota')
+        if protocol == 'tasmota':
+            return dict(
+                protocol="tasmota",
+                address=self.config["address"],
+                username=self.config.get("tasmota_username", ""),
+                password=self.config.get("tasmota_password", "")
+            )
+        else:  # tuya
+            return dict(
+                protocol="tuya",
+                address=self.config["address"],
+                device_id=self.config.get("device_id", ""),
+                local_key=self.config.get("local_key", ""),
+                version=self.config.get("version", "3.3")
+            )
+
+    def _reconnect(self):
+        if self._device_kwargs is None:
+            self._device_kwargs = self._build_device_kwargs()
+        kwargs = self._device_kwargs
+        protocol = kwargs['protocol']
+        self._logger.info(f"Reconnecting to {protocol} device at {kwargs['address']}")
+
+        try:
+            self.device = ShenzhenSmartPlug(**kwargs)
+            self._logger.info(f"{protocol.title()} device reconnected successfully")
+        except Exception as e:
+            self._logger.error(f"Failed to reconnect to {protocol} device: {type(e).__name__}: {e}")
+            self.device = None
+            raise
+
+    def reload_settings(self):
+        if self._setting_getters is None:
+            # Bind the precomputed getter names to this instance's settings
+            # object once; iteration order and types come from _DEFAULTS.
+            self._setting_getters = {
+                k: getattr(self._settings, name)
+                for k, name in _SETTING_GETTER_NAMES.items()
+            }
+
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        for k, getter in self._setting_getters.items():
+            v = getter([k])
+            self.config[k] = v
+            if debug_enabled:
+                self._logger.debug("{}: {}".format(k, v))
+
+        # Apply the cache TTL before the early return so tuning it takes
+        # effect even when nothing else changed. 0 is a valid value (always
+        # poll the outlet), so only fall back to the default on None.
+        cache_ttl = self.config.get('cache_ttl')
+        self._cache_ttl = _DEFAULTS['cache_ttl'] if cache_ttl is None else cache_ttl
+
+        # Skip the teardown/reconnect when a save didn't actually change
+        # anything; this keeps the existing device session alive. cache_ttl
+        # only tunes polling, so it doesn't participate in the hash.
+        new_hash = hash(tuple(sorted(
+            (k, v) for k, v in self.config.items() if k != 'cache_ttl'
+        )))
+        if new_hash == self._config_hash:
+            self._logger.debug("Settings unchanged, keeping current device connection")
+            return
+        self._config_hash = new_hash
+        # Settings changed: rebuild the device kwargs once here so later
+        # reconnects (e.g. after a dropped connection) don't re-read config.
+        self._device_kwargs = self._build_device_kwargs()
+
+        try:
+            protocol = self.config.get('protocol', 'tasmota')
+            self._logger.info(f"Config loaded: protocol={protocol}, address={self.config.get('address')}")
+            self._reconnect()
+        except Exception as e:
+            self._logger.error(f"Failed to connect to device: {type(e).__name__}: {e}", exc_info=True)
+            self.device = None
+            # Let the next save retry the connection even with identical values
+            self._config_hash = None
+
+    def on_startup(self, host, port):
+        if self._registered:
+            self._logger.debug("Already registered with PSUControl, skipping")
+            return
+
+        if self._psucontrol_helpers is None:
+            self._psucontrol_helpers = self._plugin_manager.get_helpers("psucontrol")
+        psucontrol_helpers = self._psucontrol_helpers
+        if not psucontrol_helpers or 'register_plugin' not in psucontrol_helpers:
+            self._logger.warning("The version of PSUControl that is installed does not support plugin registration.")
+            return
+
+        self._logger.info("Registering plugin with PSUControl")
+        psucontrol_helpers['register_plugin'](self)
+        self._registered = True
+
+    def turn_psu_on(self):
+        if not self.device:
+            self._logger.warning("Device not connected, reconnecting...")
+            self._reconnect()
+        self._logger.info("Switching PSU On")
+        try:
+            self.device.set_status(True)
+            with self._get_lock():
+                self.last_status = True
+                # The switch just confirmed the state; treat it as a fresh
+                # fetch so the next polls are served from cache.
+                self._last_fetch_ts = time.monotonic()
+            self._logger.info("PSU turned ON successfully")
+        except Exception as e:
+            self._logger.error(f"Failed to switch PSU On: {type(e).__name__}: {e}", exc_info=True)
+            self.device = None
+            raise
+
+    def turn_psu_off(self):
+        if not self.device:
+            self._logger.warning("Device not connected, reconnecting...")
+            self._reconnect()
+        self._logger.info("Switching PSU Off")
+        try:
+            self.device.set_status(False)
+            with self._get_lock():
+                self.last_status = False
+                self._last_fetch_ts = time.monotonic()
+            self._logger.info("PSU turned OFF successfully")
+        except Exception as e:
+            self._logger.error(f"Failed to switch PSU Off: {type(e).__name__}: {e}", exc_info=True)
+            self.device = None
+            raise
+
+    def _fetch_psu_state(self):
+        if not self.device:
+            self._logger.warning("Device not connected, reconnecting...")
+            self._reconnect()
+        self._logger.info("Fetching PSU state")
+        try:
+            status = self.device.get_status()
+            with self._get_lock():
+                self.last_status = status
+                self._last_fetch_ts = time.monotonic()
+            self._logger.info(f"PSU state fetched: {status}")
+        except Exception as e:
+            self._logger.error(f"Failed to get PSU state: {type(e).__name__}: {e}", exc_info=True)
+            self.device = None
+            raise
+
+    def get_psu_state(self):
+        # Single attribute read is atomic under the GIL; no lock needed on
+        # the read-only fast path.
+        cached_status = self.last_status
+
+        if cached_status is None:
+            # Cold cache: fetch on the worker but bound how long the poll
+            # thread waits, so a hung tinytuya status() can't wedge it.
+            future = _refresh_executor.submit(self._fetch_psu_state)
+            try:
+                future.result(timeout=_FETCH_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                self._logger.warning(
+                    f"PSU state fetch still running after {_FETCH_TIMEOUT}s, reporting unknown state"
+                )
+            except Exception:
+                # Already logged by _fetch_psu_state
+                pass
+            return self.last_status
+
+        if time.monotonic() - self._last_fetch_ts < self._cache_ttl:
+            # Cache is still fresh; answer the poll without any I/O.
+            return cached_status
+
+        # Refresh in the shared background worker to update the cache
+        _refresh_executor.submit(self._fetch_psu_state)
+        return cached_status
+
+    def get_template_configs(self):
+        return [
+            dict(type="settings", custom_bindings=False)
+        ]
+
+    def get_update_information(self):
+        return dict(
+            psucontrol_shenzhen=dict(
+                displayName="PSU Control - Shenzhen",
+                displayVersion=self._plugin_version,
+
+                # version check: github repository
+                type="github_release",
+                user="wafflexyzz",
+                repo="OctoPrint-PSU-Control-Tuya",
+                current=self._plugin_version,
+
+                # update method: pip w/ dependency links
+                pip="https://github.com/wafflexyzz/OctoPrint-PSU-Control-Tuya/archive/{target_version}.zip"
+            )
+        )
+
+
+__plugin_name__ = "PSU Control - Shenzhen"
+__plugin_pythoncompat__ = ">=3.7,<4"
+
+def __plugin_load__():
+    global __plugin_implementation__
+    __plugin_implementation__ = PSUControl_Shenzhen()
+
+    global __plugin_hooks__
+    __plugin_hooks__ = {
+        "octoprint.plugin.softwareupdate.check_config": __plugin_implementation__.get_update_information
+    }
@@ -11,13 +11,53 @@ The Tasmota method is recommended for reliability as it doesn't have the
 connection dropping issues common with Tuya cloud-dependent firmware.
 """
 
+import base64
+import json
 import logging
+import random
 import time
 import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
 
 log = logging.getLogger(__name__)
 
 
+class UnrecoverableTuyaError(Exception):
+    """Permanent device error (bad credentials/key); retrying won't help."""
+
+
+# tinytuya error codes that indicate a configuration problem rather than a
+# transient network issue: 904 unexpected payload (wrong local_key),
+# 914 "check device key or version". 905 is ERR_OFFLINE (device
+# unreachable) and must stay retryable.
+_UNRECOVERABLE_ERR_CODES = {"904", "914"}
+
+
+def _tcp_probe(host: str, port: int, timeout: float = 0.3):
+    """Fail fast if host:port doesn't accept a TCP connection.
+
+    A SYN probe answers "is the device there" in a few hundred
+    milliseconds, instead of blocking a full application-layer request
+    (and its 10s timeout) just to find out the device is offline.
+    """
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+    except OSError as e:
+        raise ConnectionError(f"Device at {host}:{port} is unreachable: {e}")
+
+
+def _device_error(result: dict) -> Exception:
+    """Build the right exception type for a tinytuya error response."""
+    message = f"Device error: {result.get('Error', 'Unknown')}"
+    err_code = str(result.get("Err", ""))
+    if err_code in _UNRECOVERABLE_ERR_CODES:
+        return UnrecoverableTuyaError(f"{message} (Err {err_code})")
+    return Exception(message)
+
+
 class TasmotaSmartPlug:
     """
     Control class for Tasmota/OpenBeken-flashed smart plugs via HTTP API.
@@ -49,82 +89,154 @@ class TasmotaSmartPlug:
         self.username = username
         self.password = password
         self.timeout = timeout
-        self._verify_connection()
-    
+        # Command URLs are base + pre-encoded fragment; build the base once
+        self._base_url = f"http://{address}/cm?cmnd="
+        self._session = None
+        # Last state confirmed by a device response (set or get), so a
+        # verification right after set_status doesn't need another request
+        self._last_known_state = None
+        self._last_state_ts = 0.0
+        # Connection is verified lazily on first use so constructing the
+        # controller (e.g. at plugin startup) does no network I/O.
+        self._verified = False
+
+    @property
+    def session(self):
+        """Pooled HTTP session, created on first use.
+
+        Keeping one requests.Session per device reuses the TCP connection
+        across commands instead of paying a fresh handshake per request.
+        """
+        if self._session is None:
+            session = requests.Session()
+            # One host, small pool, keep-alive pinned: back-to-back
+            # commands ride the same TCP socket. Adapter retries stay off;
+            # retry policy lives in the callers (see RobustTuyaSmartPlug
+            # for the Tuya side, PSUControl reconnect logic for HTTP).
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=4, max_retries=0
+            )
+            session.mount("http://", adapter)
+            session.headers["Connection"] = "keep-alive"
+            if self.username and self.password:
+                # Precompute the basic auth header once; session.auth would
+                # re-encode the credentials on every request. Build the
+                # bytes directly (explicit utf-8) instead of going through
+                # an intermediate formatted str.
+                auth_bytes = (self.username.encode("utf-8") + b":"
+                              + self.password.encode("utf-8"))
+                session.headers["Authorization"] = \
+                    "Basic " + base64.b64encode(auth_bytes).decode("ascii")
+            self._session = session
+        return self._session
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _ensure_connected(self):
+        """Verify the device connection on first use."""
+        if not self._verified:
+            self._verify_connection()
+            self._verified = True
+
     def _make_request(self, command: str) -> dict:
         """Make HTTP request to Tasmota device."""
-        import urllib.request
-        import urllib.error
-        import json
-        
-        url = f"http://{self.address}/cm?cmnd={command}"
-        log.debug(f"Tasmota request: {url}")
-        
+        url = self._base_url + command
+        # Guard so the f-string isn't built when debug logging is off
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Tasmota request: {url}")
+
         try:
-            # Create request with optional auth
-            request = urllib.request.Request(url)
-            
-            if self.username and self.password:
-                import base64
-                credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
-                request.add_header("Authorization", f"Basic {credentials}")
-            
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                data = response.read().decode('utf-8')
-                log.debug(f"Tasmota response: {data}")
-                return json.loads(data)
-                
-        except urllib.error.URLError as e:
-            log.error(f"Tasmota connection error: {e}")
-            raise Exception(f"Cannot connect to Tasmota device at {self.address}: {e}")
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Tasmota response: {response.text}")
+            # Decodes straight from the response bytes; no intermediate str
+            return response.json()
+
+        # requests' JSONDecodeError subclasses RequestException, so the
+        # invalid-body case must be caught before the connection errors
         except json.JSONDecodeError as e:
             log.error(f"Invalid Tasmota response: {e}")
             raise Exception(f"Invalid response from Tasmota device: {e}")
+        except requests.exceptions.RequestException as e:
+            log.error(f"Tasmota connection error: {e}")
+            raise Exception(f"Cannot connect to Tasmota device at {self.address}: {e}")
     
     def _verify_connection(self):
         """Verify connection to the Tasmota device."""
         log.info(f"Connecting to Tasmota device at {self.address}")
         try:
-            status = self._make_request("Status%200")
+            host, _, port = self.address.partition(":")
+            _tcp_probe(host, int(port) if port else 80)
+            # Bare "Status" returns just the base section (~200 B) instead
+            # of the full "Status 0" blob (several KB); it still carries
+            # DeviceName and works on both Tasmota and OpenBeken.
+            status = self._make_request("Status")
             device_name = status.get("Status", {}).get("DeviceName", "Unknown")
             log.info(f"Connected to Tasmota device: {device_name}")
         except Exception as e:
             log.error(f"Failed to connect to Tasmota device: {e}")
             raise
     
-    def get_status(self) -> bool:
+    def get_status(self, max_age: float = 0.0) -> bool:
         """
         Get the current on/off status of the plug.
-        
+
+        Args:
+            max_age: accept a state confirmed by the device within this
+                many seconds (e.g. by a preceding set_status) without
+                issuing another request; 0 always queries the device
+
         Returns:
             bool: True if the plug is on, False if off
         """
+        if (max_age > 0.0 and self._last_known_state is not None
+                and time.monotonic() - self._last_state_ts < max_age):
+            return self._last_known_state
+
         log.info(f"Getting status from Tasmota device at {self.address}")
         try:
+            self._ensure_connected()
             result = self._make_request("Power")
             power_state = result.get("POWER", result.get("POWER1", "OFF"))
             is_on = power_state.upper() == "ON"
+            self._last_known_state = is_on
+            self._last_state_ts = time.monotonic()
             log.info(f"Tasmota device is {'ON' if is_on else 'OFF'}")
             return is_on
         except Exception as e:
             log.error(f"Failed to get Tasmota status: {e}")
             raise
-    
-    def set_status(self, status: bool):
+
+    def set_status(self, status: bool) -> bool:
         """
         Set the on/off status of the plug.
-        
+
+        The Power response already reports the resulting state, so callers
+        can use the return value instead of a follow-up get_status.
+
         Args:
             status: True to turn on, False to turn off
+
+        Returns:
+            bool: the state reported by the device after the command
         """
         action = "ON" if status else "OFF"
         log.info(f"Setting Tasmota device at {self.address} to {action}")
         try:
-            result = self._make_request(f"Power%20{action}")
+            self._ensure_connected()
+            result = self._make_request("Power%20ON" if status else "Power%20OFF")
             power_state = result.get("POWER", result.get("POWER1", ""))
             if power_state.upper() != action:
                 log.warning(f"Power state mismatch: expected {action}, got {power_state}")
+            self._last_known_state = power_state.upper() == "ON"
+            self._last_state_ts = time.monotonic()
             log.info(f"Successfully set Tasmota device to {action}")
+            return self._last_known_state
         except Exception as e:
             log.error(f"Failed to set Tasmota status: {e}")
             raise
@@ -140,6 +252,7 @@ class TasmotaSmartPlug:
     def toggle(self):
         """Toggle the plug state."""
         log.info("Toggling Tasmota device")
+        self._ensure_connected()
         self._make_request("Power%20TOGGLE")
 
 
@@ -156,8 +269,30 @@ class RobustTuyaSmartPlug:
         local_key (str): Tuya local key for encryption
     """
     
+    __slots__ = (
+        "address", "device_id", "local_key", "version", "_version_f",
+        "device", "_connected", "_conn_lock", "_last_raw_status", "_last_raw_ts",
+        "_last_state", "_last_state_ts",
+        "_failures", "_circuit_open_until",
+        "_push_listening", "_listener_thread", "_listener_stop",
+    )
+
     MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
+    # Capped exponential backoff with jitter between attempts; tune via
+    # these class attributes if a device needs gentler or faster retries.
+    BASE_DELAY = 0.5  # seconds before the first retry
+    MAX_DELAY = 10.0  # backoff cap in seconds
+    JITTER = 0.5  # +/- fraction of randomization applied to each delay
+    RAW_STATUS_TTL = 1.0  # seconds a raw status() response stays reusable
+    TOGGLE_STATE_TTL = 2.0  # seconds a known state lets toggle skip the read
+    # Circuit breaker: after FAIL_THRESHOLD consecutive failed operations,
+    # fail fast for a growing cooldown instead of re-paying the retry cost
+    TUYA_PORT = 6668  # local protocol TCP port, used for the reachability probe
+    FAIL_THRESHOLD = 3
+    COOLDOWN_BASE = 2.0  # seconds for the first cooldown window
+    COOLDOWN_MAX = 10.0  # seconds cap for the cooldown window
+    # Hard budget for one operation including all retries and backoff
+    OVERALL_TIMEOUT = 15.0
     
     def __init__(self, address: str, device_id: str, local_key: str, version: str = "3.3"):
         """
@@ -173,69 +308,238 @@ class RobustTuyaSmartPlug:
         self.device_id = device_id
         self.local_key = local_key
         self.version = version
+        # Parse the protocol version once; reconnects reuse the float. A
+        # bad value fails here instead of after the whole retry loop.
+        self._version_f = float(version) if version else 3.3
+        if self._version_f not in (3.1, 3.2, 3.3, 3.4, 3.5):
+            raise ValueError(
+                f"Unsupported Tuya protocol version: {version!r} "
+                f"(expected 3.1, 3.2, 3.3, 3.4 or 3.5)"
+            )
         self.device = None
-        self._connect_with_retry()
+        self._connected = False
+        # Serializes connect/teardown; Tuya stock firmware accepts a single
+        # TCP client, so racing reconnects would kick each other off.
+        self._conn_lock = threading.RLock()
+        self._last_raw_status = None
+        self._last_raw_ts = 0.0
+        self._last_state = None
+        self._last_state_ts = 0.0
+        self._failures = 0
+        self._circuit_open_until = 0.0
+        self._push_listening = False
+        self._listener_thread = None
+        self._listener_stop = None
+        # Connection is established lazily by _ensure_connected on first
+        # use; constructing the controller does no network I/O.
     
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff delay before retrying after the given 0-based attempt."""
+        delay = min(self.MAX_DELAY, self.BASE_DELAY * (2 ** attempt))
+        return delay * (1 + random.uniform(-self.JITTER, self.JITTER))
+
     def _connect_with_retry(self):
         """Create a connection to the smart plug with retry logic."""
         import tinytuya
-        
+
+        with self._conn_lock:
+            self._connect_with_retry_locked(tinytuya)
+
+    def _connect_with_retry_locked(self, tinytuya):
+        # Another thread may have finished connecting while we waited
+        if self._connected:
+            return
+
+        # The OutletDevice itself is stateless between requests; allocate it
+        # once and reuse it across reconnects, only re-probing the device.
+        if self.device is None:
+            self.device = tinytuya.OutletDevice(
+                dev_id=self.device_id,
+                address=self.address,
+                local_key=self.local_key,
+                version=self._version_f
+            )
+
+            # Increase timeout for more reliability
+            self.device.set_socketTimeout(10)
+            self.device.set_socketRetryLimit(3)
+            # Keep the TCP socket open between commands; tinytuya otherwise
+            # pays handshake + session negotiation per operation
+            self.device.set_socketPersistent(True)
+
         last_error = None
         for attempt in range(self.MAX_RETRIES):
             try:
                 log.info(f"Connecting to Tuya device at {self.address} (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                
-                self.device = tinytuya.OutletDevice(
-                    dev_id=self.device_id,
-                    address=self.address,
-                    local_key=self.local_key,
-                    version=float(self.version) if self.version else 3.3
-                )
-                
-                # Increase timeout for more reliability
-                self.device.set_socketTimeout(10)
-                self.device.set_socketRetryLimit(3)
-                
+
+                # Cheap reachability gate before the full protocol handshake
+                _tcp_probe(self.address, self.TUYA_PORT)
+
                 # Test the connection
                 test_status = self.device.status()
                 log.info(f"Connection test response: {test_status}")
                 
                 if "Error" in test_status:
-                    error_msg = test_status.get("Error", "Unknown error")
-                    raise Exception(f"Device error: {error_msg}")
-                
+                    raise _device_error(test_status)
+
+                # Keep the probe response so a status read right after
+                # connecting doesn't hit the device a second time.
+                self._last_raw_status = test_status
+                self._last_raw_ts = time.monotonic()
+
+                self._connected = True
                 log.info(f"Successfully connected to Tuya device at {self.address}")
                 return
-                
+
+            except (UnrecoverableTuyaError, ValueError):
+                # Configuration problem; more attempts can't fix it
+                raise
             except Exception as e:
                 last_error = e
                 log.warning(f"Connection attempt {attempt + 1} failed: {e}")
                 if attempt < self.MAX_RETRIES - 1:
-                    log.info(f"Retrying in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
+                    delay = self._retry_delay(attempt)
+                    log.info(f"Retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
         
         raise Exception(f"Failed to connect after {self.MAX_RETRIES} attempts: {last_error}")
     
     def _ensure_connected(self):
         """Ensure the device is connected, reconnect if necessary."""
-        if self.device is None:
-            self._connect_with_retry()
+        if self._connected:
+            return
+        with self._conn_lock:
+            if not self._connected:
+                self._connect_with_retry()
+
+    def start_push_listener(self):
+        """Receive push state updates over the persistent socket.
+
+        Tuya devices send unsolicited DPS updates on a persistent socket,
+        so listening turns polling traffic into event traffic and also
+        catches changes made at the physical button or the vendor app.
+        While the listener runs, get_status answers from the pushed state
+        without any network call. The listener owns the socket's receive
+        side, so this is meant for monitoring-style usage; it is not
+        enabled by default for the OctoPrint plugin path.
+        """
+        if self._push_listening:
+            return
+        self._ensure_connected()
+        self._listener_stop = threading.Event()
+        self._push_listening = True
+        self._listener_thread = threading.Thread(
+            target=self._listen_for_updates,
+            daemon=True,
+            name=f"tuya-push-{self.address}"
+        )
+        self._listener_thread.start()
+        log.info(f"Push listener started for {self.address}")
+
+    def stop_push_listener(self):
+        """Stop the push listener; get_status polls again afterwards."""
+        if not self._push_listening:
+            return
+        self._push_listening = False
+        self._listener_stop.set()
+
+    def _listen_for_updates(self):
+        stop = self._listener_stop
+        while not stop.is_set():
+            try:
+                payload = self.device.receive()
+            except Exception as e:
+                log.debug(f"Push listener receive failed: {e}")
+                stop.wait(1.0)
+                continue
+            if not payload or "dps" not in payload:
+                continue
+            dps = payload["dps"]
+            if "1" in dps:
+                self._last_state = bool(dps["1"])
+                self._last_state_ts = time.monotonic()
+                log.info(f"Push update: device is {'ON' if self._last_state else 'OFF'}")
+
+    def _reset_socket(self):
+        """Close the device's socket so the next use reconnects.
+
+        Leaves an active push listener running; its receive() errors
+        until the reconnect completes and then resumes.
+        """
+        with self._conn_lock:
+            if self.device is not None:
+                try:
+                    self.device.close()
+                except Exception as e:
+                    log.debug(f"Error closing device socket: {e}")
+            self._connected = False
+
+    def close(self):
+        """Shut down the push listener and close the persistent socket."""
+        self.stop_push_listener()
+        self._reset_socket()
     
-    def _execute_with_retry(self, operation, operation_name: str):
-        """Execute an operation with retry logic."""
+    def _execute_with_retry(self, operation, operation_name: str, timeout: float = None):
+        """Execute an operation with retry logic and a circuit breaker.
+
+        Args:
+            operation: callable performing the actual device I/O
+            operation_name: label used in logs and error messages
+            timeout: overall budget in seconds for all attempts combined;
+                defaults to OVERALL_TIMEOUT
+        """
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            raise ConnectionError(
+                f"Device at {self.address} marked down for another {remaining:.1f}s "
+                f"after {self._failures} consecutive failures"
+            )
+
+        budget = self.OVERALL_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + budget
+
         last_error = None
         for attempt in range(self.MAX_RETRIES):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"{operation_name} exceeded its {budget:.1f}s budget "
+                    f"after {attempt} attempts: {last_error}"
+                )
             try:
                 self._ensure_connected()
-                return operation()
+                result = operation()
+                self._failures = 0
+                return result
+            except (UnrecoverableTuyaError, ValueError):
+                # Bad device_id/local_key or protocol mismatch is permanent;
+                # fail fast instead of burning the whole retry budget.
+                raise
             except Exception as e:
                 last_error = e
                 log.warning(f"{operation_name} attempt {attempt + 1} failed: {e}")
-                self.device = None  # Force reconnection
+                # A persistent socket may be stale after a failure; close it
+                # so the next attempt reconnects cleanly (device object and
+                # any push listener kept)
+                self._reset_socket()
                 if attempt < self.MAX_RETRIES - 1:
-                    log.info(f"Retrying {operation_name} in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
+                    # Never sleep past the overall deadline
+                    delay = min(self._retry_delay(attempt),
+                                max(0.0, deadline - time.monotonic()))
+                    if delay > 0:
+                        log.info(f"Retrying {operation_name} in {delay:.1f} seconds...")
+                        time.sleep(delay)
         
+        self._failures += 1
+        if self._failures >= self.FAIL_THRESHOLD:
+            cooldown = min(
+                self.COOLDOWN_MAX,
+                self.COOLDOWN_BASE * (2 ** (self._failures - self.FAIL_THRESHOLD))
+            )
+            self._circuit_open_until = time.monotonic() + cooldown
+            log.warning(
+                f"{self._failures} consecutive failures; failing fast for the next {cooldown:.1f}s"
+            )
+
         raise Exception(f"{operation_name} failed after {self.MAX_RETRIES} attempts: {last_error}")
     
     def get_status(self) -> bool:
@@ -246,14 +550,31 @@ class RobustTuyaSmartPlug:
             bool: True if the plug is on, False if off
         """
         def _get_status():
+            if self._push_listening and self._last_state is not None:
+                # The listener keeps _last_state current from push updates
+                return self._last_state
             log.info(f"Getting status from Tuya device at {self.address}")
-            status = self.device.status()
-            
+            if (self._last_raw_status is not None
+                    and time.monotonic() - self._last_raw_ts < self.RAW_STATUS_TTL):
+                status = self._last_raw_status
+            else:
+                status = self.device.status()
+                self._last_raw_status = status
+                self._last_raw_ts = time.monotonic()
+
             if "Error" in status:
-                raise Exception(f"Device error: {status.get('Error', 'Unknown')}")
-            
-            dps = status.get("dps", {})
-            is_on = dps.get("1", False)
+                raise _device_error(status)
+
+            # DPS index "1" is the relay state on these outlets; a direct
+            # lookup beats the .get chain and a missing key is exceptional.
+            try:
+                dps = status["dps"]
+                is_on = bool(dps["1"])
+            except KeyError:
+                log.warning(f"No relay state in status response: {status}")
+                return False
+            self._last_state = is_on
+            self._last_state_ts = time.monotonic()
             log.info(f"Tuya device is {'ON' if is_on else 'OFF'} (DPS: {dps})")
             return is_on
         
@@ -276,8 +597,14 @@ class RobustTuyaSmartPlug:
                 result = self.device.turn_off()
             
             if result and "Error" in result:
-                raise Exception(f"Device error: {result.get('Error', 'Unknown')}")
-            
+                raise _device_error(result)
+
+            # State changed; the cached raw status is no longer valid, but
+            # the commanded state itself is now known.
+            self._last_raw_status = None
+            self._last_state = status
+            self._last_state_ts = time.monotonic()
+
             log.info(f"Successfully set Tuya device to {action}")
             return result
         
@@ -293,10 +620,34 @@ class RobustTuyaSmartPlug:
     
     def toggle(self):
         """Toggle the plug state."""
+        if (self._last_state is not None
+                and time.monotonic() - self._last_state_ts < self.TOGGLE_STATE_TTL):
+            # Fresh known state: a single set call instead of the full
+            # read-modify-write (two round trips through the retry path)
+            self.set_status(not self._last_state)
+            return
         current_status = self.get_status()
         self.set_status(not current_status)
 
 
+def _build_tasmota(address, kwargs):
+    return TasmotaSmartPlug(
+        address=address,
+        username=kwargs.get("username", ""),
+        password=kwargs.get("password", ""),
+        timeout=kwargs.get("timeout", 10)
+    )
+
+
+def _build_tuya(address, kwargs):
+    return RobustTuyaSmartPlug(
+        address=address,
+        device_id=kwargs.get("device_id", ""),
+        local_key=kwargs.get("local_key", ""),
+        version=kwargs.get("version", "3.3")
+    )
+
+
 class ShenzhenSmartPlug:
     """
     Factory class that creates the appropriate smart plug controller
@@ -309,7 +660,14 @@ class ShenzhenSmartPlug:
     
     PROTOCOL_TASMOTA = "tasmota"
     PROTOCOL_TUYA = "tuya"
-    
+
+    # Protocol name -> controller builder, resolved with one dict lookup
+    # instead of an if/elif chain per construction.
+    _PROTOCOL_FACTORIES = {
+        PROTOCOL_TASMOTA: _build_tasmota,
+        PROTOCOL_TUYA: _build_tuya,
+    }
+
     def __init__(self, protocol: str, address: str, **kwargs):
         """
         Initialize the appropriate smart plug controller.
@@ -324,43 +682,96 @@ class ShenzhenSmartPlug:
         self.protocol = protocol.lower()
         self.address = address
         self._device = None
+        # Short-TTL status cache: UI polling bursts collapse into a single
+        # round trip while staying fresh enough for display purposes.
+        self._status_cache = None
+        self._status_ts = 0.0
+        self._status_ttl = kwargs.get("status_ttl", 0.5)
+        # Single-flight: concurrent status reads share one device call
+        self._inflight = None
+        self._inflight_lock = threading.Lock()
         
         log.info(f"Creating {self.protocol} smart plug controller for {address}")
-        
-        if self.protocol == self.PROTOCOL_TASMOTA:
-            self._device = TasmotaSmartPlug(
-                address=address,
-                username=kwargs.get("username", ""),
-                password=kwargs.get("password", ""),
-                timeout=kwargs.get("timeout", 10)
-            )
-        elif self.protocol == self.PROTOCOL_TUYA:
-            self._device = RobustTuyaSmartPlug(
-                address=address,
-                device_id=kwargs.get("device_id", ""),
-                local_key=kwargs.get("local_key", ""),
-                version=kwargs.get("version", "3.3")
-            )
-        else:
+
+        try:
+            factory = self._PROTOCOL_FACTORIES[self.protocol]
+        except KeyError:
             raise ValueError(f"Unknown protocol: {protocol}. Use 'tasmota' or 'tuya'")
+        self._device = factory(address, kwargs)
     
     def get_status(self) -> bool:
-        """Get the current on/off status of the plug."""
-        return self._device.get_status()
-    
+        """Get the current on/off status of the plug (cached briefly).
+
+        Concurrent callers are coalesced: only one thread performs the
+        device round trip while the others wait for its result.
+        """
+        if (self._status_cache is not None
+                and time.monotonic() - self._status_ts < self._status_ttl):
+            return self._status_cache
+
+        with self._inflight_lock:
+            future = self._inflight
+            if future is not None:
+                leader = False
+            else:
+                future = Future()
+                self._inflight = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            status = self._device.get_status()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._status_cache = status
+            self._status_ts = time.monotonic()
+            future.set_result(status)
+            return status
+        finally:
+            with self._inflight_lock:
+                self._inflight = None
+
     def set_status(self, status: bool):
         """Set the on/off status of the plug."""
         self._device.set_status(status)
-    
+        # Blind write: the command succeeded, so cache the commanded state
+        self._status_cache = status
+        self._status_ts = time.monotonic()
+
     def turn_on(self):
         """Turn the plug on."""
-        self._device.turn_on()
-    
+        self.set_status(True)
+
     def turn_off(self):
         """Turn the plug off."""
-        self._device.turn_off()
-    
+        self.set_status(False)
+
     def toggle(self):
         """Toggle the plug state."""
         self._device.toggle()
+        # Resulting state is unknown here; force the next read to refetch
+        self._status_ts = 0.0
+
+    @staticmethod
+    def batch_get_status(devices: list) -> list:
+        """
+        Fetch get_status() for several plug controllers concurrently.
+
+        urllib/tinytuya release the GIL during socket I/O, so a small
+        thread pool turns N sequential round trips into roughly one.
+
+        Args:
+            devices: plug controllers exposing get_status()
+
+        Returns:
+            list: status of each device, in input order
+        """
+        if not devices:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(devices))) as executor:
+            return list(executor.map(lambda device: device.get_status(), devices))
 
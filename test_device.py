@@ -19,15 +19,34 @@ logging.basicConfig(
 
 def test_tasmota():
     """Test Tasmota/OpenBeken device connection."""
-    from octoprint_psucontrol_tapo.shenzhen import TasmotaSmartPlug
-    
+    from octoprint_psucontrol_tapo.shenzhen import TasmotaSmartPlug, ShenzhenSmartPlug
+
     print("\n=== Tasmota / OpenBeken Device Connection Test ===\n")
     print("(Works with both Tasmota and OpenBeken firmware)\n")
-    
-    address = input("Enter device IP address (e.g., 192.168.1.100): ").strip()
+
+    address = input("Enter device IP address(es), comma-separated for several (e.g., 192.168.1.100): ").strip()
     username = input("Enter username (leave blank if none): ").strip()
     password = input("Enter password (leave blank if none): ").strip()
-    
+
+    addresses = [a.strip() for a in address.split(",") if a.strip()]
+    if not addresses:
+        print("\n✗ Error: no device address entered")
+        print("Please run again and enter the IP address of your smart plug.")
+        sys.exit(1)
+    if len(addresses) > 1:
+        # Query all devices concurrently, then run the full on/off
+        # sequence against the first one only.
+        print(f"\n--- Checking {len(addresses)} devices in parallel ---")
+        devices = [TasmotaSmartPlug(a, username, password) for a in addresses]
+        try:
+            statuses = ShenzhenSmartPlug.batch_get_status(devices)
+        except Exception as e:
+            print(f"\n✗ Error querying devices: {type(e).__name__}: {e}")
+            sys.exit(1)
+        for a, status in zip(addresses, statuses):
+            print(f"✓ {a}: {'ON' if status else 'OFF'}")
+    address = addresses[0]
+
     print(f"\n--- Testing connection to {address} ---")
     
     try: